@@ -2,17 +2,70 @@
 
 from __future__ import unicode_literals
 
-import array
-import io
+import functools
 import numpy as np
 import struct
 import warnings
-import codecs
+
+try:
+    from functools import cached_property
+except ImportError:  # Python 3.7
+    class cached_property(object):
+        '''Minimal stand-in for `functools.cached_property`, storing the value on first access.'''
+        def __init__(self, func):
+            self.func = func
+            self.__doc__ = func.__doc__
+
+        def __set_name__(self, owner, name):
+            self.attrname = name
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            value = instance.__dict__[self.attrname] = self.func(instance)
+            return value
+
 
 PROCESSOR_INTEL = 84
 PROCESSOR_DEC = 85
 PROCESSOR_MIPS = 86
 
+# Precompiled binary formats for fixed size fields.
+_S_f = struct.Struct('f')
+_S_I_LE = struct.Struct('<I')
+_S_I_BE = struct.Struct('>I')
+_S_B = struct.Struct('B')
+_S_bb = struct.Struct('bb')
+_S_bB = struct.Struct('bB')
+_S_h_LE = struct.Struct('<h')
+_S_h_BE = struct.Struct('>h')
+
+# Data types used for reading file data, indexed by attribute name in DataTypes.
+_DTYPE_NAMES = ('float32', 'float64', 'uint8', 'uint16', 'uint32', 'uint64', 'int8', 'int16', 'int32', 'int64')
+# Big-Endian (SGI/MIPS format)
+_MIPS_DTYPES = {name: np.dtype(name).newbyteorder('>') for name in _DTYPE_NAMES}
+# Little-Endian format (Intel or DEC format)
+_LE_DTYPES = {name: np.dtype(name) for name in _DTYPE_NAMES}
+
+# Number of bytes read at once by Reader.read_frames(), rounded down to whole frames.
+_FRAME_READ_SIZE = 1 << 16
+
+# Struct format characters for single values, indexed by dtype kind and size.
+_STRUCT_CHARS = {'i1': 'b', 'u1': 'B', 'i2': 'h', 'u2': 'H', 'i4': 'i', 'u4': 'I',
+                 'i8': 'q', 'u8': 'Q', 'f4': 'f', 'f8': 'd'}
+_SCALAR_STRUCTS = {}
+
+
+def _scalar_unpacker(dtype):
+    '''Get the cached unpack_from function and scalar type used to read a single value of a data type.'''
+    try:
+        return _SCALAR_STRUCTS[dtype]
+    except KeyError:
+        dt = np.dtype(dtype)
+        fmt = ('>' if dt.str[0] == '>' else '<') + _STRUCT_CHARS[dt.str[1:]]
+        unpacker = _SCALAR_STRUCTS[dtype] = (struct.Struct(fmt).unpack_from, dt.type)
+        return unpacker
+
 
 class DataTypes(object):
     ''' Container defining different data types used for reading file data.
@@ -20,30 +73,9 @@ class DataTypes(object):
     '''
     def __init__(self, proc_type):
         self.proc_type = proc_type
-        if proc_type == PROCESSOR_MIPS:
-            # Big-Endian (SGI/MIPS format)
-            self.float32 = np.dtype(np.float32).newbyteorder('>')
-            self.float64 = np.dtype(np.float64).newbyteorder('>')
-            self.uint8 = np.uint8
-            self.uint16 = np.dtype(np.uint16).newbyteorder('>')
-            self.uint32 = np.dtype(np.uint32).newbyteorder('>')
-            self.uint64 = np.dtype(np.uint64).newbyteorder('>')
-            self.int8 = np.int8
-            self.int16 = np.dtype(np.int16).newbyteorder('>')
-            self.int32 = np.dtype(np.int32).newbyteorder('>')
-            self.int64 = np.dtype(np.int64).newbyteorder('>')
-        else:
-            # Little-Endian format (Intel or DEC format)
-            self.float32 = np.float32
-            self.float64 = np.float64
-            self.uint8 = np.uint8
-            self.uint16 = np.uint16
-            self.uint32 = np.uint32
-            self.uint64 = np.uint64
-            self.int8 = np.int8
-            self.int16 = np.int16
-            self.int32 = np.int32
-            self.int64 = np.int64
+        dtypes = _MIPS_DTYPES if proc_type == PROCESSOR_MIPS else _LE_DTYPES
+        for name, dtype in dtypes.items():
+            setattr(self, name, dtype)
 
     @property
     def is_ieee(self):
@@ -66,27 +98,27 @@ class DataTypes(object):
     def decode_string(self, bytes):
         ''' Decode a byte array to a string.
         '''
-        # Attempt to decode using different decoders
-        decoders = ['utf-8', 'latin-1']
-        for dec in decoders:
-            try:
-                return codecs.decode(bytes, dec)
-            except UnicodeDecodeError:
-                continue
-        # Revert to using default decoder but replace characters
-        return codecs.decode(bytes, decoders[0], 'replace')
+        # Most strings are pure ASCII, which decode identically in all supported encodings
+        if bytes.isascii():
+            return bytes.decode('ascii')
+        # Attempt to decode as utf-8
+        try:
+            return bytes.decode('utf-8')
+        except UnicodeDecodeError:
+            # Every byte value is a valid latin-1 character, decoding can't fail
+            return bytes.decode('latin-1')
 
 
 def UNPACK_FLOAT_IEEE(uint_32):
     '''Unpacks a single 32 bit unsigned int to a IEEE float representation
     '''
-    return struct.unpack('f', struct.pack("<I", uint_32))[0]
+    return _S_f.unpack(_S_I_LE.pack(uint_32))[0]
 
 
 def UNPACK_FLOAT_MIPS(uint_32):
     '''Unpacks a single 32 bit unsigned int to a IEEE float representation
     '''
-    return struct.unpack('f', struct.pack(">I", uint_32))[0]
+    return _S_f.unpack(_S_I_BE.pack(uint_32))[0]
 
 
 def DEC_to_IEEE(uint_32):
@@ -131,24 +163,28 @@ def DEC_to_IEEE(uint_32):
     return UNPACK_FLOAT_IEEE(reshuffled)
 
 
-def DEC_to_IEEE_BYTES(bytes):
+def DEC_to_IEEE_BYTES(bytes, out=None):
     '''Convert byte array containing 32 bit DEC floats to IEEE format.
 
     Params:
     ----
     bytes : Byte array where every 4 bytes represent a single precision DEC float.
-    Returns : IEEE formated floating point of the same shape as the input.
+    out   : Optional contiguous uint32 array with one element per float, used to store the converted
+            words instead of allocating a new array.
+    Returns : Flat, writable float32 array holding the IEEE formated values. The array is a view
+              of the converted 32 bit words, no additional copy is made.
     '''
 
     # See comments in DEC_to_IEEE() for DEC format definition
 
-    # Reshuffle
-    bytes = np.frombuffer(bytes, dtype=np.dtype('B'))
-    reshuffled = np.empty(len(bytes), dtype=np.dtype('B'))
-    reshuffled[0::4] = bytes[2::4]
-    reshuffled[1::4] = bytes[3::4]
-    reshuffled[2::4] = bytes[0::4]
-    reshuffled[3::4] = bytes[1::4] + ((bytes[1::4] & 0x7f == 0) - 1)  # Decrement exponent by 2, if exp. > 1
+    # Reshuffle, swap the first and last 16 bits of each 32 bit word.
+    # Done as a single strided copy of the 16 bit halves into the output words,
+    # which avoids the temporaries of a shift/or based swap.
+    halves = np.frombuffer(bytes, dtype=np.dtype('<u2')).reshape(-1, 2)
+    reshuffled = np.empty(len(halves), dtype=np.dtype('<u4')) if out is None else out
+    swapped = reshuffled.view(np.dtype('<u2')).reshape(-1, 2)
+    swapped[:, 0] = halves[:, 1]
+    swapped[:, 1] = halves[:, 0]
 
     # There are different ways to adjust for differences in DEC/IEEE representation
     # after reshuffle. Two simple methods are:
@@ -160,13 +196,107 @@ def DEC_to_IEEE_BYTES(bytes):
     # 2) Exponent == 0, DEC numbers are then 0 or undefined while IEEE is not. NaN are produced when exponent == 255.
     # Here method 1) is used, which mean that only small numbers will be represented incorrectly.
 
-    return np.frombuffer(reshuffled.tobytes(),
-                         dtype=np.float32,
-                         count=int(len(bytes) / 4))
+    # Decrement exponent by 2, if exp. > 1 (branchless, subtract 1 from the 7 high exponent bits when non-zero)
+    adjust = np.bitwise_and(reshuffled, 0x7F000000)
+    np.not_equal(adjust, 0, out=adjust)
+    np.left_shift(adjust, 24, out=adjust)
+    reshuffled -= adjust
+
+    return reshuffled.view(np.float32)
+
+
+@functools.lru_cache(maxsize=256)
+def _split_key(key):
+    '''Split a 'GROUP:PARAM' or 'GROUP.PARAM' key into upper case group and param names.
+
+    The param name is None if the key only identifies a group. Results are cached since
+    the same few keys are looked up repeatedly.
+    '''
+    group = key.upper()
+    param = None
+    if '.' in group:
+        group, param = group.split('.', 1)
+    if ':' in group:
+        group, param = group.split(':', 1)
+    return group, param
+
 
 def is_integer(value):
     '''Check if value input is integer.'''
-    return isinstance(value, (int, np.int32, np.int64))
+    return isinstance(value, (int, np.integer))
+
+
+# Number of bits set in each 7-bit camera-observation mask.
+_CAMERA_COUNTS = np.array([bin(mask).count('1') for mask in range(128)], np.float32)
+
+
+def _camera_count(words):
+    '''Count the cameras observing each point sample.
+
+    Parameters
+    ----------
+    words : ndarray
+        Integer array with the last (residual and camera mask) word of each point sample.
+
+    Returns
+    -------
+    count : ndarray
+        Number of bits set in bits 8-14 (camera-observation byte) of each word, as float32.
+    '''
+    return _CAMERA_COUNTS[(words >> 8) & 0x7f]
+
+
+@functools.lru_cache(maxsize=1)
+def _point_word_table():
+    '''Build a table decoding the last word of a point sample to its residual byte and camera count.
+
+    Returns
+    -------
+    table : ndarray
+        Read-only array indexed by the unsigned 16-bit word, where each 8 byte item packs the
+        float32 (residual byte, camera count) pair of the word. For words with the sign bit
+        (bit 15) set, indicating an invalid sample, the pair is (NaN, -1). The residual byte is
+        not scaled, so a single table is shared by all files, see `_scale_residuals`.
+    '''
+    words = np.arange(0x10000)
+    table = np.empty((0x10000, 2), np.float32)
+    table[:, 0] = words & 0xff
+    table[:, 1] = _camera_count(words)
+    table[0x8000:, 0] = np.nan
+    table[0x8000:, 1] = -1
+    # Pack each pair into a single item, gathering whole items is faster than gathering rows
+    table = table.view(np.uint64).ravel()
+    table.flags.writeable = False
+    return table
+
+
+def _scale_residuals(residuals, scale_mag):
+    '''Scale residual bytes decoded by `_point_word_table` in place, invalid samples become -1.
+
+    Parameters
+    ----------
+    residuals : ndarray
+        Float32 residual bytes, or NaN for invalid samples.
+    scale_mag : float
+        Magnitude of the point scale factor.
+    '''
+    np.multiply(residuals, scale_mag, out=residuals)
+    # NaN entries are replaced by -1, scaled residuals are never negative
+    np.fmax(residuals, -1, out=residuals)
+
+
+def _word_halves(words):
+    '''View the low and high 16 bit halves of a contiguous int32 array.
+
+    Returns
+    -------
+    low, high : ndarray
+        Unsigned 16-bit views of bits 0-15 and bits 16-31 of each word.
+    '''
+    halves = words.view(np.uint16).reshape(words.shape + (2,))
+    if np.little_endian:
+        return halves[..., 0], halves[..., 1]
+    return halves[..., 1], halves[..., 0]
 
 class Header(object):
     '''Header information from a C3D file.
@@ -213,6 +343,10 @@ class Header(object):
     BINARY_FORMAT_WRITE = '<BBHHHHHfHHf274sHHH164s44s'
     BINARY_FORMAT_READ = '<BBHHHHHIHHI274sHHH164s44s'
     BINARY_FORMAT_READ_BIG_ENDIAN = '>BBHHHHHIHHI274sHHH164s44s'
+    # Precompiled header formats
+    _HEADER_WRITE = struct.Struct(BINARY_FORMAT_WRITE)
+    _HEADER_READ = struct.Struct(BINARY_FORMAT_READ)
+    _HEADER_READ_BIG_ENDIAN = struct.Struct(BINARY_FORMAT_READ_BIG_ENDIAN)
 
     def __init__(self, handle=None):
         '''Create a new Header object.
@@ -242,7 +376,7 @@ class Header(object):
 
         self.event_block = b''
         self.event_timings = np.zeros(0, dtype=np.float32)
-        self.event_disp_flags = np.zeros(0, dtype=np.bool)
+        self.event_disp_flags = np.zeros(0, dtype=bool)
         self.event_labels = []
 
         if handle:
@@ -262,25 +396,25 @@ class Header(object):
             handle must be writeable.
         '''
         handle.seek(0)
-        handle.write(struct.pack(self.BINARY_FORMAT_WRITE,
-                                 # Pack vars:
-                                 self.parameter_block,
-                                 0x50,
-                                 self.point_count,
-                                 self.analog_count,
-                                 self.first_frame,
-                                 self.last_frame,
-                                 self.max_gap,
-                                 self.scale_factor,
-                                 self.data_block,
-                                 self.analog_per_frame,
-                                 self.frame_rate,
-                                 b'',
-                                 self.long_event_labels and 0x3039 or 0x0,  # If True write long_event_key else 0
-                                 self.event_count,
-                                 0x0,
-                                 self.event_block,
-                                 b''))
+        handle.write(self._HEADER_WRITE.pack(
+                     # Pack vars:
+                     self.parameter_block,
+                     0x50,
+                     self.point_count,
+                     self.analog_count,
+                     self.first_frame,
+                     self.last_frame,
+                     self.max_gap,
+                     self.scale_factor,
+                     self.data_block,
+                     self.analog_per_frame,
+                     self.frame_rate,
+                     b'',
+                     self.long_event_labels and 0x3039 or 0x0,  # If True write long_event_key else 0
+                     self.event_count,
+                     0x0,
+                     self.event_block,
+                     b''))
 
     def __str__(self):
         '''Return a string representation of this Header's attributes.'''
@@ -298,7 +432,7 @@ class Header(object):
 long_event_labels: {0.long_event_labels}
       event_block: {0.event_block}'''.format(self)
 
-    def read(self, handle, fmt=BINARY_FORMAT_READ):
+    def read(self, handle, fmt=_HEADER_READ):
         '''Read and parse binary header data from a file handle.
 
         This method reads exactly 512 bytes from the beginning of the given file
@@ -311,13 +445,16 @@ long_event_labels: {0.long_event_labels}
             will be read to initialize the attributes in this Header. The handle
             must be readable.
 
-        fmt : Formating string used to read the header.
+        fmt : str or struct.Struct
+            Formating string, or precompiled struct, used to read the header.
 
         Raises
         ------
         AssertionError
             If the magic byte from the header is not 80 (the C3D magic value).
         '''
+        if not isinstance(fmt, struct.Struct):
+            fmt = struct.Struct(fmt)
         handle.seek(0)
         raw = handle.read(512)
 
@@ -337,7 +474,7 @@ long_event_labels: {0.long_event_labels}
          self.event_count,
          __,
          self.event_block,
-         _) = struct.unpack(fmt, raw)
+         _) = fmt.unpack(raw)
 
         # Check magic number
         assert magic == 80, 'C3D magic {} != 80 !'.format(magic)
@@ -352,22 +489,19 @@ long_event_labels: {0.long_event_labels}
         if dtypes.is_dec:
             self.scale_factor = DEC_to_IEEE(self.scale_factor)
             self.frame_rate = DEC_to_IEEE(self.frame_rate)
-            float_unpack = DEC_to_IEEE
         elif dtypes.is_ieee:
             self.scale_factor = UNPACK_FLOAT_IEEE(self.scale_factor)
             self.frame_rate = UNPACK_FLOAT_IEEE(self.frame_rate)
-            float_unpack = UNPACK_FLOAT_IEEE
         elif dtypes.is_mips:
             # Re-read header in big-endian
-            self.read(handle, Header.BINARY_FORMAT_READ_BIG_ENDIAN)
+            self.read(handle, Header._HEADER_READ_BIG_ENDIAN)
             # Then unpack
             self.scale_factor = UNPACK_FLOAT_IEEE(self.scale_factor)
             self.frame_rate = UNPACK_FLOAT_IEEE(self.frame_rate)
-            float_unpack = UNPACK_FLOAT_IEEE
 
-        self._parse_events(dtypes, float_unpack)
+        self._parse_events(dtypes)
 
-    def _parse_events(self, dtypes, float_unpack):
+    def _parse_events(self, dtypes):
         ''' Parse the event section of the header.
         '''
 
@@ -376,21 +510,15 @@ long_event_labels: {0.long_event_labels}
         disp_bytes = self.event_block[72:90]
         label_bytes = self.event_block[92:]
 
-        if dtypes.is_mips:
-            unpack_fmt = '>I'
-        else:
-            unpack_fmt = '<I'
-
         read_count = self.event_count
-        self.event_timings = np.zeros(read_count, dtype=np.float32)
-        self.event_disp_flags = np.zeros(read_count, dtype=np.bool)
-        self.event_labels = np.empty(read_count, dtype=object)
-        for i in range(read_count):
-            ilong = i*4
-            # Unpack
-            self.event_disp_flags[i] = disp_bytes[i] > 0
-            self.event_timings[i] = float_unpack(struct.unpack(unpack_fmt, time_bytes[ilong:ilong+4])[0])
-            self.event_labels[i] = dtypes.decode_string(label_bytes[ilong:ilong+4])
+        # Unpack
+        if dtypes.is_dec:
+            self.event_timings = DEC_to_IEEE_BYTES(time_bytes[:read_count*4])
+        else:  # is_ieee or is_mips
+            self.event_timings = np.frombuffer(time_bytes, dtype=dtypes.float32, count=read_count).astype(np.float32)
+        self.event_disp_flags = np.frombuffer(disp_bytes, dtype=np.uint8, count=read_count) > 0
+        self.event_labels = np.array([dtypes.decode_string(label_bytes[i*4:i*4+4]) for i in range(read_count)],
+                                     dtype=object)
 
     @property
     def events(self):
@@ -417,7 +545,7 @@ class Param(object):
     bytes_per_element : int, optional
         For array data, this describes the size of each element of data. For
         string data (including arrays of strings), this should be -1.
-    dimensions : list of int
+    dimensions : tuple of int
         For array data, this describes the dimensions of the array, stored in
         column-major order. For arrays of strings, the dimensions here will be
         the number of columns (length of each string) followed by the number of
@@ -425,7 +553,8 @@ class Param(object):
     bytes : str
         Raw data for this parameter.
     handle :
-        File handle positioned at the first byte of a .c3d parameter description.
+        File handle positioned at the first byte of a .c3d parameter description,
+        or a memoryview starting with the parameter description.
     '''
 
     def __init__(self,
@@ -441,21 +570,34 @@ class Param(object):
         self._dtypes = dtype
         self.desc = desc
         self.bytes_per_element = bytes_per_element
-        self.dimensions = dimensions or []
+        self.dimensions = dimensions or ()
         self.bytes = bytes
-        if handle:
+        if isinstance(handle, memoryview):
+            self._read_buffer(handle)
+        elif handle:
             self.read(handle)
 
     def __repr__(self):
         return '<Param: {}>'.format(self.desc)
 
     @property
-    def num_elements(self):
-        '''Return the number of elements in this parameter's array value.'''
+    def dimensions(self):
+        '''Dimensions of the parameter array, stored in column-major order.'''
+        return self._dimensions
+
+    @dimensions.setter
+    def dimensions(self, value):
+        '''Set the parameter dimensions and update the cached element count.'''
+        self._dimensions = value = tuple(value)
         e = 1
-        for d in self.dimensions:
+        for d in value:
             e *= d
-        return e
+        self._num_elements = e
+
+    @property
+    def num_elements(self):
+        '''Return the number of elements in this parameter's array value.'''
+        return self._num_elements
 
     @property
     def total_bytes(self):
@@ -485,18 +627,21 @@ class Param(object):
         handle : file handle
             An open, writable, binary file handle.
         '''
+        handle.write(self._pack(group_id))
+
+    def _pack(self, group_id):
+        '''Assemble the binary record for this parameter.'''
         name = self.name.encode('utf-8')
-        handle.write(struct.pack('bb', len(name), group_id))
-        handle.write(name)
-        handle.write(struct.pack('<h', self.binary_size() - 2 - len(name)))
-        handle.write(struct.pack('b', self.bytes_per_element))
-        handle.write(struct.pack('B', len(self.dimensions)))
-        handle.write(struct.pack('B' * len(self.dimensions), *self.dimensions))
-        if self.bytes:
-            handle.write(self.bytes)
         desc = self.desc.encode('utf-8')
-        handle.write(struct.pack('B', len(desc)))
-        handle.write(desc)
+        return b''.join((
+            _S_bb.pack(len(name), group_id),
+            name,
+            _S_h_LE.pack(self.binary_size() - 2 - len(name)),
+            _S_bB.pack(self.bytes_per_element, len(self.dimensions)),
+            bytes(self.dimensions),
+            self.bytes,
+            _S_B.pack(len(desc)),
+            desc))
 
     def read(self, handle):
         '''Read binary data for this parameter from a file handle.
@@ -504,25 +649,44 @@ class Param(object):
         This reads exactly enough data from the current position in the file to
         initialize the parameter.
         '''
-        self.bytes_per_element, = struct.unpack('b', handle.read(1))
-        dims, = struct.unpack('B', handle.read(1))
-        self.dimensions = [struct.unpack('B', handle.read(1))[
-            0] for _ in range(dims)]
+        self.bytes_per_element, dims = _S_bB.unpack(handle.read(2))
+        self.dimensions = tuple(handle.read(dims))
         self.bytes = b''
         if self.total_bytes:
             self.bytes = handle.read(self.total_bytes)
-        desc_size, = struct.unpack('B', handle.read(1))
+        desc_size, = _S_B.unpack(handle.read(1))
         self.desc = desc_size and self._dtypes.decode_string(handle.read(desc_size)) or ''
 
+    def _read_buffer(self, buffer):
+        '''Read binary data for this parameter from a memoryview.
+
+        Equivalent to `read()`, but slices the buffer instead of reading from a file handle.
+        '''
+        self.bytes_per_element, dims = _S_bB.unpack(buffer[:2])
+        pos = 2 + dims
+        self.dimensions = tuple(buffer[2:pos])
+        self.bytes = buffer[pos:pos + self.total_bytes].tobytes()
+        pos += len(self.bytes)
+        desc_size, = _S_B.unpack(buffer[pos:pos + 1])
+        self.desc = desc_size and self._dtypes.decode_string(buffer[pos + 1:pos + 1 + desc_size].tobytes()) or ''
+
     def _as(self, dtype):
         '''Unpack the raw bytes of this param using the given struct format.'''
-        return np.frombuffer(self.bytes, count=1, dtype=dtype)[0]
+        unpack_from, scalar_type = _scalar_unpacker(dtype)
+        try:
+            return scalar_type(unpack_from(self.bytes)[0])
+        except struct.error:
+            raise ValueError('buffer is smaller than requested size') from None
 
     def _as_array(self, dtype):
         '''Unpack the raw bytes of this param using the given data format.'''
         assert self.dimensions, \
             '{}: cannot get value as {} array!'.format(self.name, dtype)
+        dtype = np.dtype(dtype)
         elems = np.frombuffer(self.bytes, dtype=dtype)
+        if not dtype.isnative:
+            # Swap bytes once so the returned array is in native byte order (MIPS format)
+            elems = elems.byteswap().view(dtype.newbyteorder('='))
         # Reverse shape as the shape is defined in fortran format
         return elems.reshape(self.dimensions[::-1])
 
@@ -717,7 +881,12 @@ class Param(object):
 
     @property
     def bytes_array(self):
-        '''Get the param as an array of raw byte strings.'''
+        '''Get the param as an array of raw byte strings.
+
+        For multi-dimensional parameters the array holds fixed width byte
+        words (numpy ``S`` dtype) copied from the parameter data, note that
+        trailing null bytes are not part of the words.
+        '''
         # Decode different dimensions
         if len(self.dimensions) == 0:
             return np.array([])
@@ -727,14 +896,12 @@ class Param(object):
             # Convert Fortran shape (data in memory is identical, shape is transposed)
             word_len = self.dimensions[0]
             dims = self.dimensions[1:][::-1]  # Identical to: [:0:-1]
-            byte_steps = np.cumprod(self.dimensions[:-1])[::-1]
-            # Generate mult-dimensional array and parse byte words
-            byte_arr = np.empty(dims, dtype=object)
-            for i in np.ndindex(*dims):
-                # Calculate byte offset as sum of each array index times the byte step of each dimension.
-                off = np.sum(np.multiply(i, byte_steps))
-                byte_arr[i] = self.bytes[off:off+word_len]
-            return byte_arr
+            if word_len == 0:
+                return np.zeros(dims, dtype=np.dtype('S1'))
+            # View the buffer as an array of byte words, copied so the result is writable
+            byte_arr = np.frombuffer(self.bytes, dtype=np.dtype('S%i' % word_len),
+                                     count=self.num_elements // word_len)
+            return byte_arr.reshape(dims).copy()
 
     @property
     def string_array(self):
@@ -745,12 +912,8 @@ class Param(object):
         elif len(self.dimensions) == 1:
             return np.array([self.string_value])
         else:
-            # Parse byte sequences
-            byte_arr = self.bytes_array
-            # Decode sequences
-            for i in np.ndindex(byte_arr.shape):
-                byte_arr[i] = self._dtypes.decode_string(byte_arr[i])
-            return byte_arr
+            # Parse byte sequences and decode each word
+            return np.vectorize(self._dtypes.decode_string, otypes=[object])(self.bytes_array)
 
 
 class Group(object):
@@ -772,6 +935,8 @@ class Group(object):
     def __init__(self, dtypes, name=None, desc=None):
         self._params = {}
         self._dtypes = dtypes
+        # Numerical key of the group, assigned by the Manager holding the group
+        self._group_id = None
         # Assign through property setters
         self.name = name
         self.desc = desc
@@ -795,6 +960,8 @@ class Group(object):
         '''
         if value is None or isinstance(value, str):
             self._name = value
+            # Encoded name, as written to file
+            self._name_bytes = None if value is None else value.encode('utf-8')
         else:
             raise TypeError('Expected group name to be string, was %s.' % type(value))
 
@@ -817,6 +984,8 @@ class Group(object):
         elif value is not None and not isinstance(value, str):
             raise TypeError('Expected descriptor to be byte string or python string, was %s.' % type(value))
         self._desc = value
+        # Encoded descriptor, as written to file
+        self._desc_bytes = value.encode('utf-8') if isinstance(value, str) else value
 
     def param_items(self):
         ''' Acquire iterator for paramater key-entry pairs. '''
@@ -847,6 +1016,13 @@ class Group(object):
         '''
         return self._params.get(key, default)
 
+    def _get_param(self, key):
+        '''Get a parameter by key, the key is only case-normalized if not found as given.'''
+        param = self._params.get(key)
+        if param is None:
+            param = self._params[key.upper()]
+        return param
+
     def add_param(self, name, **kwargs):
         '''Add a parameter to this group.
 
@@ -897,9 +1073,9 @@ class Group(object):
         '''Return the number of bytes to store this group and its parameters.'''
         return (
             1 +  # group_id
-            1 + len(self._name.encode('utf-8')) +  # size of name and name bytes
+            1 + len(self._name_bytes) +  # size of name and name bytes
             2 +  # next offset marker
-            1 + len(self._desc.encode('utf-8')) +  # size of desc and desc bytes
+            1 + len(self._desc_bytes) +  # size of desc and desc bytes
             sum(p.binary_size() for p in self._params.values()))
 
     def write(self, group_id, handle):
@@ -912,51 +1088,53 @@ class Group(object):
         handle : file handle
             An open, writable, binary file handle.
         '''
-        name = self._name.encode('utf-8')
-        desc = self._desc.encode('utf-8')
-        handle.write(struct.pack('bb', len(name), -group_id))
-        handle.write(name)
-        handle.write(struct.pack('<h', 3 + len(desc)))
-        handle.write(struct.pack('B', len(desc)))
-        handle.write(desc)
-        for param in self._params.values():
-            param.write(group_id, handle)
+        name = self._name_bytes
+        desc = self._desc_bytes
+        # Assemble the group record followed by its parameter records and write them in a single call
+        records = [
+            _S_bb.pack(len(name), -group_id),
+            name,
+            _S_h_LE.pack(3 + len(desc)),
+            _S_B.pack(len(desc)),
+            desc]
+        records.extend(param._pack(group_id) for param in self._params.values())
+        handle.write(b''.join(records))
 
     def get_int8(self, key):
         '''Get the value of the given parameter as an 8-bit signed integer.'''
-        return self._params[key.upper()].int8_value
+        return self._get_param(key).int8_value
 
     def get_uint8(self, key):
         '''Get the value of the given parameter as an 8-bit unsigned integer.'''
-        return self._params[key.upper()].uint8_value
+        return self._get_param(key).uint8_value
 
     def get_int16(self, key):
         '''Get the value of the given parameter as a 16-bit signed integer.'''
-        return self._params[key.upper()].int16_value
+        return self._get_param(key).int16_value
 
     def get_uint16(self, key):
         '''Get the value of the given parameter as a 16-bit unsigned integer.'''
-        return self._params[key.upper()].uint16_value
+        return self._get_param(key).uint16_value
 
     def get_int32(self, key):
         '''Get the value of the given parameter as a 32-bit signed integer.'''
-        return self._params[key.upper()].int32_value
+        return self._get_param(key).int32_value
 
     def get_uint32(self, key):
         '''Get the value of the given parameter as a 32-bit unsigned integer.'''
-        return self._params[key.upper()].uint32_value
+        return self._get_param(key).uint32_value
 
     def get_float(self, key):
         '''Get the value of the given parameter as a 32-bit float.'''
-        return self._params[key.upper()].float_value
+        return self._get_param(key).float_value
 
     def get_bytes(self, key):
         '''Get the value of the given parameter as a byte array.'''
-        return self._params[key.upper()].bytes_value
+        return self._get_param(key).bytes_value
 
     def get_string(self, key):
         '''Get the value of the given parameter as a string.'''
-        return self._params[key.upper()].string_value
+        return self._get_param(key).string_value
 
 
 class Manager(object):
@@ -975,7 +1153,8 @@ class Manager(object):
     def __init__(self, header=None):
         '''Set up a new Manager with a Header.'''
         self._header = header or Header()
-        self._groups = {}
+        self._groups_by_name = {}
+        self._groups_by_id = {}
 
     @property
     def header(self):
@@ -990,7 +1169,7 @@ class Manager(object):
         items : Touple of ((str, :class:`Group`), ...)
             Python touple containing pairs of name keys and parameter group entries.
         '''
-        return ((k, v) for k, v in self._groups.items() if isinstance(k, str))
+        return self._groups_by_name.items()
 
     def group_values(self):
         ''' Acquire iterable over parameter group entries.
@@ -1000,7 +1179,7 @@ class Manager(object):
         values : Touple of (:class:`Group`, ...)
             Python touple containing unique parameter group entries.
         '''
-        return (v for k, v in self._groups.items() if isinstance(k, str))
+        return self._groups_by_name.values()
 
     def group_keys(self):
         ''' Acquire iterable over parameter group entry string keys.
@@ -1010,7 +1189,7 @@ class Manager(object):
         keys : Touple of (str, ...)
             Python touple containing keys for the parameter group entries.
         '''
-        return (k for k in self._groups.keys() if isinstance(k, str))
+        return self._groups_by_name.keys()
 
     def group_listed(self):
         ''' Acquire iterable over sorted numerical parameter group pairs.
@@ -1020,7 +1199,7 @@ class Manager(object):
         items : Touple of ((int, :class:`Group`), ...)
             Sorted python touple containing pairs of numerical keys and parameter group entries.
         '''
-        return sorted((i, g) for i, g in self._groups.items() if isinstance(i, int))
+        return sorted(self._groups_by_id.items())
 
     def _check_metadata(self):
         ''' Ensure that the metadata in our file is self-consistent. '''
@@ -1119,10 +1298,10 @@ class Manager(object):
         if not isinstance(name, str):
             raise ValueError('Expected Group name key to be string, was %s.' % type(name))
         group_id = int(group_id) # Assert python int
-        if group_id in self._groups:
+        if group_id in self._groups_by_id:
             raise KeyError('Group with numerical key {} already exists'.format(group_id))
         name = name.upper()
-        if name in self._groups:
+        if name in self._groups_by_name:
             if rename_duplicated_groups is True:
                 # In some cases group name is not unique (though c3d spec requires that).
                 # To allow using such files we auto-generate new name.
@@ -1133,9 +1312,14 @@ class Manager(object):
             else:
                 raise KeyError(f'A group with the name {name} already exists.')
 
-        group = self._groups[name] = self._groups[group_id] = Group(self._dtypes, name, desc)
+        group = self._groups_by_name[name] = self._groups_by_id[group_id] = Group(self._dtypes, name, desc)
+        group._group_id = group_id
         return group
 
+    def _group_dict(self, key):
+        '''Get the group dictionary indexed by keys of the same type as the given key.'''
+        return self._groups_by_id if is_integer(key) else self._groups_by_name
+
     def remove_group(self, group_id):
         '''Remove the parameter group.
 
@@ -1144,12 +1328,14 @@ class Manager(object):
         group_id : int, or str
             The numeric or name ID key for a group to remove all entries for.
         '''
-        grp = self._groups.get(group_id, None)
+        grp = self._group_dict(group_id).get(group_id, None)
         if grp is None:
             return
-        gkeys = [k for (k, v) in self._groups.items() if v == grp]
-        for k in gkeys:
-            del self._groups[k]
+        # Groups are stored under their own name and numerical key
+        if self._groups_by_name.get(grp.name) is grp:
+            del self._groups_by_name[grp.name]
+        if self._groups_by_id.get(grp._group_id) is grp:
+            del self._groups_by_id[grp._group_id]
 
     def rename_group(self, group_id, new_group_id):
         ''' Rename a specified parameter group.
@@ -1170,26 +1356,31 @@ class Manager(object):
             grp = group_id
         else:
             # Aquire instance using id
-            grp = self._groups.get(group_id, None)
+            grp = self._group_dict(group_id).get(group_id, None)
             if grp is None:
                 raise KeyError('No group found matching the identifier: %s' % str(group_id))
-        if new_group_id in self._groups:
+        if isinstance(new_group_id, bytes):
+            new_group_id = grp._dtypes.decode_string(new_group_id)
+        groups = self._group_dict(new_group_id)
+        if new_group_id in groups:
             if new_group_id == group_id:
                 return
             raise ValueError('Key %s for group %s already exist.' % (str(new_group_id), grp.name))
 
         # Clear old id
-        if isinstance(new_group_id, (str, bytes)):
-            if grp.name in self._groups:
-                del self._groups[grp.name]
-            grp._name = new_group_id
+        if isinstance(new_group_id, str):
+            if grp.name in groups:
+                del groups[grp.name]
+            grp.name = new_group_id
         elif is_integer(new_group_id):
             new_group_id = int(new_group_id) # Ensure python int
-            del self._groups[group_id]
+            if groups.get(grp._group_id) is grp:
+                del groups[grp._group_id]
+            grp._group_id = new_group_id
         else:
             raise KeyError('Invalid group identifier of type: %s' % str(type(new_group_id)))
         # Update
-        self._groups[new_group_id] = grp
+        groups[new_group_id] = grp
 
     def get(self, group, default=None):
         '''Get a group or parameter.
@@ -1212,16 +1403,11 @@ class Manager(object):
             is found, returns the default value.
         '''
         if is_integer(group):
-            return self._groups.get(int(group), default)
-        group = group.upper()
-        param = None
-        if '.' in group:
-            group, param = group.split('.', 1)
-        if ':' in group:
-            group, param = group.split(':', 1)
-        if group not in self._groups:
+            return self._groups_by_id.get(int(group), default)
+        group, param = _split_key(group)
+        if group not in self._groups_by_name:
             return default
-        group = self._groups[group]
+        group = self._groups_by_name[group]
         if param is not None:
             return group.get(param, default)
         return group
@@ -1264,7 +1450,7 @@ class Manager(object):
 
     def parameter_blocks(self):
         '''Compute the size (in 512B blocks) of the parameter section.'''
-        bytes = 4. + sum(g.binary_size() for g in self._groups.values())
+        bytes = 4. + sum(g.binary_size() for g in self._groups_by_id.values())
         return int(np.ceil(bytes / 512))
 
     @property
@@ -1363,7 +1549,7 @@ class Manager(object):
             # Can be encoded either as 32 bit float or 16 bit uint
             end_frame[3] = param._as_integer_value
         # Return the largest of the all (queue bad reading...)
-        return int(np.max(end_frame))
+        return int(max(end_frame))
 
 
 class Reader(Manager):
@@ -1377,6 +1563,12 @@ class Reader(Manager):
     >>> r = c3d.Reader(open('capture.c3d', 'rb'))
     >>> for frame_no, points, analog in r.read_frames():
     ...     print('{0.shape} points in this frame'.format(points))
+
+    Metadata properties such as `point_used` and `frame_count` are parsed once
+    and cached. The cache is cleared when groups are added, removed or renamed
+    through the reader, but not when parameters are edited directly (e.g. by
+    assigning `Param.bytes`), the properties then remain a snapshot of the
+    metadata as it was first accessed.
     '''
 
     def __init__(self, handle):
@@ -1400,55 +1592,68 @@ class Reader(Manager):
 
         self._handle = handle
 
-        def seek_param_section_header():
-            ''' Seek to and read the first 4 byte of the parameter header section '''
-            self._handle.seek((self._header.parameter_block - 1) * 512)
-            # metadata header
-            return self._handle.read(4)
-
-        # Begin by reading the processor type:
-        buf = seek_param_section_header()
-        _, _, parameter_blocks, processor = struct.unpack('BBBB', buf)
+        # Begin by reading the processor type from the 4 byte parameter section header:
+        param_start = (self._header.parameter_block - 1) * 512
+        self._handle.seek(param_start)
+        _, _, parameter_blocks, processor = struct.unpack('BBBB', self._handle.read(4))
         self._dtypes = DataTypes(processor)
         # Convert header parameters in accordance with the processor type (MIPS format re-reads the header)
         self._header._processor_convert(self._dtypes, handle)
 
-        # Restart reading the parameter header after parsing processor type
-        buf = seek_param_section_header()
-
-        start_byte = self._handle.tell()
-        endbyte = start_byte + 512 * parameter_blocks - 4
-        while self._handle.tell() < endbyte:
-            chars_in_name, group_id = struct.unpack('bb', self._handle.read(2))
+        # Return to the first parameter record, the section header has already been parsed
+        self._handle.seek(param_start + 4)
+
+        # Bind the unpack and decode functions used for each record
+        unpack_offset = (_S_h_BE if self._dtypes.is_mips else _S_h_LE).unpack
+        unpack_header = _S_bb.unpack
+        decode_string = self._dtypes.decode_string
+
+        # Read the parameter section with a single read and parse the records from memory,
+        # pos is the read position relative to the first byte after the parameter header.
+        endbyte = 512 * parameter_blocks - 4
+        section = memoryview(self._handle.read(endbyte))
+        pos = 0
+        while pos < endbyte:
+            chars_in_name, group_id = unpack_header(section[pos:pos + 2])
+            pos += 2
             if group_id == 0 or chars_in_name == 0:
                 # we've reached the end of the parameter section.
                 break
-            name = self._dtypes.decode_string(self._handle.read(abs(chars_in_name))).upper()
-
-            # Read the byte segment associated with the parameter and create a
-            # separate binary stream object from the data.
-            offset_to_next, = struct.unpack(['<h', '>h'][self._dtypes.is_mips], self._handle.read(2))
+            name = section[pos:pos + abs(chars_in_name)].tobytes()
+            pos += len(name)
+            name = decode_string(name).upper()
+
+            # Read the byte segment associated with the parameter, as a view
+            # into the parameter section.
+            offset_to_next, = unpack_offset(section[pos:pos + 2])
+            pos += 2
             if offset_to_next == 0:
                 # Last parameter, as number of bytes are unknown,
                 # read the remaining bytes in the parameter section.
-                bytes = self._handle.read(endbyte - self._handle.tell())
+                bytes = section[pos:endbyte]
+            elif offset_to_next < 2:
+                # Invalid offset, read the remaining bytes
+                bytes = section[pos:]
             else:
-                bytes = self._handle.read(offset_to_next - 2)
-            buf = io.BytesIO(bytes)
+                bytes = section[pos:pos + offset_to_next - 2]
+            pos += len(bytes)
 
             if group_id > 0:
                 # We've just started reading a parameter. If its group doesn't
                 # exist, create a blank one. add the parameter to the group.
-                self._groups.setdefault(
-                    group_id, Group(self._dtypes)).add_param(name, handle=buf)
+                group = self._groups_by_id.get(group_id)
+                if group is None:
+                    group = self._groups_by_id[group_id] = Group(self._dtypes)
+                    group._group_id = group_id
+                group.add_param(name, handle=bytes)
             else:
                 # We've just started reading a group. If a group with the
                 # appropriate numerical id exists already (because we've
                 # already created it for a parameter), just set the name of
                 # the group. Otherwise, add a new group.
                 group_id = abs(group_id)
-                size, = struct.unpack('B', buf.read(1))
-                desc = size and buf.read(size) or ''
+                size, = _S_B.unpack(bytes[:1])
+                desc = size and bytes[1:1 + size].tobytes() or ''
                 group = self.get(group_id)
                 if group is not None:
                     self.rename_group(group, name)
@@ -1460,35 +1665,49 @@ class Reader(Manager):
 
         self._check_metadata()
 
-    def read_frames(self, copy=True):
-        '''Iterate over the data frames from our C3D file handle.
+    # Values derived from the metadata are computed on first access and stored on the instance,
+    # they are cleared when groups are added, removed or renamed.
+    point_rate = cached_property(Manager.point_rate.fget)
+    point_scale = cached_property(Manager.point_scale.fget)
+    point_used = cached_property(Manager.point_used.fget)
+    analog_used = cached_property(Manager.analog_used.fget)
+    analog_rate = cached_property(Manager.analog_rate.fget)
+    analog_per_frame = cached_property(Manager.analog_per_frame.fget)
+    analog_sample_count = cached_property(Manager.analog_sample_count.fget)
+    frame_count = cached_property(Manager.frame_count.fget)
+    first_frame = cached_property(Manager.first_frame.fget)
+    last_frame = cached_property(Manager.last_frame.fget)
+    _CACHED_METADATA = ('point_rate', 'point_scale', 'point_used', 'analog_used', 'analog_rate',
+                        'analog_per_frame', 'analog_sample_count', 'frame_count', 'first_frame', 'last_frame')
+
+    def _clear_metadata_cache(self):
+        '''Remove values derived from the metadata, they are recomputed on next access.'''
+        for name in self._CACHED_METADATA:
+            self.__dict__.pop(name, None)
+
+    def add_group(self, *args, **kwargs):
+        '''Add a new parameter group, see `Manager.add_group`.'''
+        group = super(Reader, self).add_group(*args, **kwargs)
+        self._clear_metadata_cache()
+        return group
 
-        Parameters
-        ----------
-        copy : bool
-            If False, the reader returns a reference to the same data buffers
-            for every frame. The default is True, which causes the reader to
-            return a unique data buffer for each frame. Set this to False if you
-            consume frames as you iterate over them, or True if you store them
-            for later.
+    def remove_group(self, group_id):
+        '''Remove the parameter group, see `Manager.remove_group`.'''
+        super(Reader, self).remove_group(group_id)
+        self._clear_metadata_cache()
+
+    def rename_group(self, group_id, new_group_id):
+        '''Rename a specified parameter group, see `Manager.rename_group`.'''
+        super(Reader, self).rename_group(group_id, new_group_id)
+        self._clear_metadata_cache()
+
+    def _data_format(self):
+        '''Get the format of the point and analog words stored in the data section.
 
         Returns
         -------
-        frames : sequence of (frame number, points, analog)
-            This method generates a sequence of (frame number, points, analog)
-            tuples, one tuple per frame. The first element of each tuple is the
-            frame number. The second is a numpy array of parsed, 5D point data
-            and the third element of each tuple is a numpy array of analog
-            values that were recorded during the frame. (Often the analog data
-            are sampled at a higher frequency than the 3D point data, resulting
-            in multiple analog frames per frame of point data.)
-
-            The first three columns in the returned point data are the (x, y, z)
-            coordinates of the observed motion capture point. The fourth column
-            is an estimate of the error for this particular point, and the fifth
-            column is the number of cameras that observed the point in question.
-            Both the fourth and fifth values are -1 if the point is considered
-            to be invalid.
+        format : tuple
+            Tuple (is_float, scale_mag, point_dtype, point_word_bytes, analog_dtype, analog_word_bytes).
         '''
         # Point magnitude scalar, if scale parameter is < 0 data is floating point
         # (in which case the magnitude is the absolute value)
@@ -1501,7 +1720,6 @@ class Reader(Manager):
         else:
             point_word_bytes = 2
             point_dtype = self._dtypes.int16
-        points = np.zeros((self.point_used, 5), np.float32)
 
         # TODO: handle ANALOG:BITS parameter here!
         p = self.get('ANALOG:FORMAT')
@@ -1521,56 +1739,170 @@ class Reader(Manager):
             analog_dtype = self._dtypes.int16
             analog_word_bytes = 2
 
-        analog = np.array([], float)
-        offsets = np.zeros((self.analog_used, 1), int)
+        return is_float, scale_mag, point_dtype, point_word_bytes, analog_dtype, analog_word_bytes
+
+    def _analog_conversion(self, dtype=np.float64):
+        '''Get the offsets and scales used to convert analog words.
+
+        Parameters
+        ----------
+        dtype : numpy dtype, optional
+            Floating point type of the returned offsets and scales.
+
+        Returns
+        -------
+        conversion : tuple
+            Tuple (offsets, analog_scales), offsets and scales are float vectors
+            with one entry per analog channel, broadcast over the trailing (channel) axis
+            of samples stored in file order. The scales include the general scale factor.
+        '''
+        # Channels without an entry in the parameter arrays use the defaults
+        offsets = np.zeros(self.analog_used, float)
         param = self.get('ANALOG:OFFSET')
         if param is not None:
-            offsets = param.int16_array[:self.analog_used, None]
+            values = param.int16_array[:self.analog_used]
+            offsets[:len(values)] = values
 
-        analog_scales = np.ones((self.analog_used, 1), float)
+        analog_scales = np.ones(self.analog_used, float)
         param = self.get('ANALOG:SCALE')
         if param is not None:
-            analog_scales[:, :] = param.float_array[:self.analog_used, None]
+            values = param.float_array[:self.analog_used]
+            analog_scales[:len(values)] = values
 
         gen_scale = 1.
         param = self.get('ANALOG:GEN_SCALE')
         if param is not None:
             gen_scale = param.float_value
+        # Combine the channel and general scale so samples are scaled in a single pass
+        analog_scales *= gen_scale
+
+        return offsets.astype(dtype, copy=False), analog_scales.astype(dtype, copy=False)
+
+    def read_frames(self, copy=True, analog_dtype=np.float64):
+        '''Iterate over the data frames from our C3D file handle.
+
+        Parameters
+        ----------
+        copy : bool
+            If False, the reader returns a reference to the same data buffers
+            for every frame. The buffers are overwritten in place when the next
+            frame is read, no arrays are allocated per frame. The default is
+            True, which causes the reader to return a unique data buffer for
+            each frame. Set this to False if you consume frames as you iterate
+            over them, or True if you store them for later.
+        analog_dtype : numpy dtype, optional
+            Floating point type of the returned analog data, and of the arithmetic used
+            to convert the analog samples. Defaults to float64, pass float32 to halve
+            the memory used for analog data.
+
+        Returns
+        -------
+        frames : sequence of (frame number, points, analog)
+            This method generates a sequence of (frame number, points, analog)
+            tuples, one tuple per frame. The first element of each tuple is the
+            frame number. The second is a numpy array of parsed, 5D point data
+            and the third element of each tuple is a numpy array of analog
+            values that were recorded during the frame. (Often the analog data
+            are sampled at a higher frequency than the 3D point data, resulting
+            in multiple analog frames per frame of point data.)
+
+            The first three columns in the returned point data are the (x, y, z)
+            coordinates of the observed motion capture point. The fourth column
+            is an estimate of the error for this particular point, and the fifth
+            column is the number of cameras that observed the point in question.
+            Both the fourth and fifth values are -1 if the point is considered
+            to be invalid.
+        '''
+        is_float, scale_mag, point_dtype, point_word_bytes, analog_word_dtype, analog_word_bytes = self._data_format()
+        offsets, analog_scales = self._analog_conversion(analog_dtype)
+
+        # Resolve metadata used in the frame loop once, properties are parsed from parameters on access
+        point_used = self.point_used
+        analog_used = self.analog_used
+        first_frame = self.first_frame
+        last_frame = self.last_frame
+        is_dec = self._dtypes.is_dec
+        float32_dtype = self._dtypes.float32
+        uint16_dtype = self._dtypes.uint16
+        read = self._handle.read
+        point_shape = (point_used, 4)
+        word_table = _point_word_table()
+        # Decoded (residual byte, camera count) pairs, gathered from the table for every frame
+        pairs = np.empty(point_used, word_table.dtype)
+        pairs_view = pairs.view(np.float32).reshape((point_used, 2))
+
+        points = np.zeros((point_used, 5), np.float32)
+        # View of the (x, y, z, residual) columns, written in place for every frame
+        points_xyzr = points[:, :4]
+        analog = np.array([], analog_dtype)
 
         # Seek to the start point of the data blocks
         self._handle.seek((self._header.data_block - 1) * 512)
         # Number of values (words) read in regard to POINT/ANALOG data
-        N_point = 4 * self.point_used
-        N_analog = self.analog_used * self.analog_per_frame
+        N_point = 4 * point_used
+        N_analog = analog_used * self.analog_per_frame
         # Total bytes per frame
         point_bytes = N_point * point_word_bytes
         analog_bytes = N_analog * analog_word_bytes
+        frame_bytes = point_bytes + analog_bytes
+        if is_float:
+            # Integer value of the residual and camera word of float data, viewed as
+            # 16 bit halves, and the table index, reused for every frame
+            last_word = np.empty(point_used, np.int32)
+            low_word, high_word = _word_halves(last_word)
+            words = np.empty(point_used, np.uint16)
+        if is_float and is_dec:
+            # Buffers for the converted DEC words, reused for every frame
+            dec_points = np.empty(N_point, np.uint32)
+            dec_analog = np.empty(N_analog, np.uint32)
+        if N_analog > 0:
+            # Converted analog data, overwritten in place for every frame through
+            # a (sample, channel) view matching the order of the words in the file
+            analog = np.empty((analog_used, N_analog // analog_used), analog_dtype)
+            analog_samples = analog.T
+        # Frames are read in chunks of several frames, each frame is then parsed from the chunk.
+        # Chunks are read into a single reused buffer if the handle supports it.
+        frames_per_read = max(1, _FRAME_READ_SIZE // max(frame_bytes, 1))
+        readinto = getattr(self._handle, 'readinto', None)
+        if readinto is not None:
+            chunk_buffer = memoryview(bytearray(frame_bytes * frames_per_read))
+        chunk = memoryview(b'')
+        offset = 0
         # Parse the data blocks
-        for frame_no in range(self.first_frame, self.last_frame + 1):
-            # Read the byte data (used) for the block
-            raw_bytes = self._handle.read(N_point * point_word_bytes)
-            raw_analog = self._handle.read(N_analog * analog_word_bytes)
+        for frame_no in range(first_frame, last_frame + 1):
+            if offset == len(chunk):
+                size = frame_bytes * min(frames_per_read, last_frame + 1 - frame_no)
+                if readinto is None:
+                    chunk = memoryview(read(size))
+                else:
+                    chunk = chunk_buffer[:readinto(chunk_buffer[:size])]
+                offset = 0
+            # Byte data (used) for the block, split into point and analog bytes
+            raw_frame = chunk[offset:offset + frame_bytes]
+            offset += len(raw_frame)
+            raw_bytes = raw_frame[:point_bytes]
+            raw_analog = raw_frame[point_bytes:]
             # Verify read pointers (any of the two can be assumed to be 0)
             if len(raw_bytes) < point_bytes:
                 warnings.warn('''reached end of file (EOF) while reading POINT data at frame index {}
-                                 and file pointer {}!'''.format(frame_no - self.first_frame, self._handle.tell()))
+                                 and file pointer {}!'''.format(frame_no - first_frame, self._handle.tell()))
                 return
             if len(raw_analog) < analog_bytes:
                 warnings.warn('''reached end of file (EOF) while reading POINT data at frame index {}
-                                 and file pointer {}!'''.format(frame_no - self.first_frame, self._handle.tell()))
+                                 and file pointer {}!'''.format(frame_no - first_frame, self._handle.tell()))
                 return
 
             if is_float:
                 # Convert every 4 byte words to a float-32 reprensentation
                 # (the fourth column is still not a float32 representation)
-                if self._dtypes.is_dec:
+                if is_dec:
                     # Convert each of the first 6 16-bit words from DEC to IEEE float
-                    points[:, :4] = DEC_to_IEEE_BYTES(raw_bytes).reshape((self.point_used, 4))
+                    np.copyto(points_xyzr, DEC_to_IEEE_BYTES(raw_bytes, dec_points).reshape(point_shape))
                 else:  # If IEEE or MIPS:
                     # Re-read the raw byte representation directly
-                    points[:, :4] = np.frombuffer(raw_bytes,
-                                                  dtype=self._dtypes.float32,
-                                                  count=N_point).reshape((int(self.point_used), 4))
+                    np.copyto(points_xyzr, np.frombuffer(raw_bytes,
+                                                         dtype=float32_dtype,
+                                                         count=N_point).reshape(point_shape))
 
                 # Parse the camera-observed bits and residuals.
                 # Notes:
@@ -1580,53 +1912,148 @@ class Reader(Manager):
                 #   with the difference that the words are 16 and 8 bit respectively (see the MLS guide).
                 # - While words are 16 bit, residual and camera mask is always interpreted as 8 packed in a single word!
                 # - 16 or 32 bit may represent a sign (indication that certain files write a -1 floating point only)
-                last_word = points[:, 3].astype(np.int32)
-                valid = (last_word & 0x80008000) == 0
-                points[~valid, 3:5] = -1.0
-                c = last_word[valid]
+                np.copyto(last_word, points[:, 3], casting='unsafe')
+                # Copy the 32 bit sign (bit 15 of the high half) to bit 15 of the low half,
+                # so either sign marks the sample as invalid in the table
+                np.bitwise_and(high_word, 0x8000, out=words)
+                np.bitwise_or(words, low_word, out=words)
 
             else:
                 # Convert the bytes to a unsigned 32 bit or signed 16 bit representation
                 raw = np.frombuffer(raw_bytes,
                                     dtype=point_dtype,
-                                    count=N_point).reshape((self.point_used, 4))
+                                    count=N_point).reshape(point_shape)
                 # Read point 2 byte words in int-16 format
-                points[:, :3] = raw[:, :3] * scale_mag
+                np.multiply(raw[:, :3], scale_mag, out=points[:, :3])
 
-                # Parse last 16-bit word as two 8-bit words
-                valid = raw[:, 3] > -1
-                points[~valid, 3:5] = -1
-                c = raw[valid, 3].astype(self._dtypes.uint16)
+                # Parse last 16-bit word as two 8-bit words (negative words are invalid samples),
+                # reinterpreting the signed words as unsigned table indices
+                words = raw[:, 3].view(uint16_dtype)
 
             # Convert coordinate data
             # fourth value is floating-point (scaled) error estimate (residual)
-            points[valid, 3] = (c & 0xff).astype(np.float32) * scale_mag
-
             # fifth value is number of bits set in camera-observation byte
-            points[valid, 4] = sum((c & (1 << k)) >> k for k in range(8, 15))
-            # Get value as is: points[valid, 4] = (c >> 8)
+            # (both are decoded from the word with a single table lookup, -1 for invalid samples)
+            # (indices are always within the table, clip mode avoids buffering the output)
+            np.take(word_table, words, out=pairs, mode='clip')
+            points[:, 3:] = pairs_view
+            _scale_residuals(points[:, 3], scale_mag)
 
             # Check if analog data exist, and parse if so
             if N_analog > 0:
-                if is_float and self._dtypes.is_dec:
+                if is_float and is_dec:
                     # Convert each of the 16-bit words from DEC to IEEE float
-                    analog = DEC_to_IEEE_BYTES(raw_analog)
+                    raw = DEC_to_IEEE_BYTES(raw_analog, dec_analog)
                 else:
                     # Integer or INTEL/MIPS floating point data can be parsed directly
-                    analog = np.frombuffer(raw_analog, dtype=analog_dtype, count=N_analog)
+                    raw = np.frombuffer(raw_analog, dtype=analog_word_dtype, count=N_analog)
 
-                # Reformat and convert
-                analog = analog.reshape((-1, self.analog_used)).T
-                analog = analog.astype(float)
-                # Convert analog
-                analog = (analog - offsets) * analog_scales * gen_scale
+                # Convert analog into the output buffer
+                # (samples are converted to float before the offset is subtracted)
+                np.subtract(raw.reshape((-1, analog_used)), offsets, out=analog_samples, dtype=analog_dtype)
+                analog_samples *= analog_scales
 
             # Output buffers
             if copy:
-                yield frame_no, points.copy(), analog  # .copy(), a new array is generated per frame for analog data.
+                yield frame_no, points.copy(), analog.copy()
             else:
                 yield frame_no, points, analog
 
+        self._check_data_end()
+
+    def read_all_frames(self, analog_dtype=np.float64):
+        '''Read and convert all data frames from our C3D file handle at once.
+
+        Frames are parsed as a single block, which is considerably faster than iterating
+        over `read_frames()` but requires memory for the data of every frame.
+
+        Parameters
+        ----------
+        analog_dtype : numpy dtype, optional
+            Floating point type of the returned analog data, see `read_frames()`.
+
+        Returns
+        -------
+        points : ndarray
+            Array of shape (frame_count, point_used, 5) containing the point data of
+            each frame, formated in the same way as the points generated by `read_frames()`.
+        analog : ndarray
+            Array of shape (frame_count, analog_used, analog_per_frame) containing the analog
+            data of each frame, formated in the same way as the analog data generated by
+            `read_frames()`.
+        '''
+        is_float, scale_mag, point_dtype, point_word_bytes, analog_word_dtype, analog_word_bytes = self._data_format()
+        offsets, analog_scales = self._analog_conversion(analog_dtype)
+
+        point_used = self.point_used
+        analog_used = self.analog_used
+        analog_per_frame = self.analog_per_frame
+        # Number of values (words) read in regard to POINT/ANALOG data
+        N_point = 4 * point_used
+        N_analog = analog_used * analog_per_frame
+        # Total bytes per frame
+        point_bytes = N_point * point_word_bytes
+        frame_bytes = point_bytes + N_analog * analog_word_bytes
+        frame_count = max(self.frame_count, 0)
+
+        # Read the data blocks as a single buffer, with one row of bytes per frame
+        self._handle.seek((self._header.data_block - 1) * 512)
+        raw_bytes = self._handle.read(frame_count * frame_bytes)
+        eof = frame_bytes > 0 and len(raw_bytes) < frame_count * frame_bytes
+        if eof:
+            frame_count = len(raw_bytes) // frame_bytes
+            warnings.warn('''reached end of file (EOF) while reading POINT data at frame index {}
+                                 and file pointer {}!'''.format(frame_count, self._handle.tell()))
+        raw_frames = np.frombuffer(raw_bytes, dtype=np.uint8, count=frame_count * frame_bytes)
+        raw_frames = raw_frames.reshape((frame_count, frame_bytes))
+        raw_points = raw_frames[:, :point_bytes]
+
+        point_shape = (frame_count, point_used, 4)
+        points = np.zeros((frame_count, point_used, 5), np.float32)
+        if is_float:
+            # Convert every 4 byte words to a float-32 reprensentation
+            if self._dtypes.is_dec:
+                points[..., :4] = DEC_to_IEEE_BYTES(np.ascontiguousarray(raw_points)).reshape(point_shape)
+            else:  # If IEEE or MIPS:
+                points[..., :4] = raw_points.view(self._dtypes.float32).reshape(point_shape)
+
+            # Parse the camera-observed bits and residuals, see read_frames()
+            low_word, high_word = _word_halves(points[..., 3].astype(np.int32))
+            words = low_word | (high_word & 0x8000)
+        else:
+            raw = raw_points.view(point_dtype).reshape(point_shape)
+            # Scale the coordinates of every frame directly into the output array
+            np.multiply(raw[..., :3], scale_mag, out=points[..., :3])
+
+            # Parse last 16-bit word as two 8-bit words
+            words = raw[..., 3].astype(self._dtypes.uint16)
+
+        # fourth value is floating-point (scaled) error estimate (residual),
+        # fifth value is number of bits set in camera-observation byte
+        points[..., 3:] = _point_word_table()[words].view(np.float32).reshape(words.shape + (2,))
+        _scale_residuals(points[..., 3], scale_mag)
+
+        if N_analog > 0:
+            raw_analog = raw_frames[:, point_bytes:]
+            if is_float and self._dtypes.is_dec:
+                analog = DEC_to_IEEE_BYTES(np.ascontiguousarray(raw_analog))
+            else:
+                analog = raw_analog.view(analog_word_dtype)
+            # Convert the (frame, sample, channel) words into a single (frame, channel, sample) output array
+            raw = analog.reshape((frame_count, analog_per_frame, analog_used))
+            analog = np.empty((frame_count, analog_used, analog_per_frame), analog_dtype)
+            analog_samples = analog.transpose((0, 2, 1))
+            np.subtract(raw, offsets, out=analog_samples, dtype=analog_dtype)
+            analog_samples *= analog_scales
+        else:
+            analog = np.zeros((frame_count, analog_used, analog_per_frame), analog_dtype)
+
+        if not eof:
+            self._check_data_end()
+        return points, analog
+
+    def _check_data_end(self):
+        '''Warn if data blocks remain in the file after the last frame was read.'''
         # Function evaluating EOF, note that data section is written in blocks of 512
         final_byte_index = self._handle.tell()
         self._handle.seek(0, 2)  # os.SEEK_END)
@@ -1669,6 +2096,15 @@ class Writer(Manager):
         The units that the point numbers represent. Defaults to ``'mm  '``.
     gen_scale : float, optional
         General scaling factor for data. Defaults to 1.
+
+    Notes
+    -----
+    Analog samples are written divided by `gen_scale`, without per channel
+    scales or offsets. When `point_scale` is positive the file stores integer
+    words, so analog samples are rounded to the nearest multiple of
+    `gen_scale` and clipped to -32768 to 32767 times `gen_scale`.
+    Pick `gen_scale` to match the resolution and range of the analog signal,
+    or use a negative `point_scale` to store floating point samples.
     '''
 
     def __init__(self,
@@ -1689,7 +2125,9 @@ class Writer(Manager):
         self._point_scale = point_scale
         self._point_units = point_units
         self._gen_scale = gen_scale
-        self._frames = []
+        # Point and analog arrays of the added frames, stored in separate lists
+        self._point_frames = []
+        self._analog_frames = []
 
     def add_frames(self, frames):
         '''Add frames to this writer instance.
@@ -1699,7 +2137,11 @@ class Writer(Manager):
         frames : sequence of (point, analog) tuples
             A sequence of frame data to add to the writer.
         '''
-        self._frames.extend(frames)
+        point_frames = self._point_frames
+        analog_frames = self._analog_frames
+        for points, analog in frames:
+            point_frames.append(points)
+            analog_frames.append(analog)
 
     def _pad_block(self, handle):
         '''Pad the file with 0s to the end of the next block boundary.'''
@@ -1723,9 +2165,10 @@ class Writer(Manager):
         self._pad_block(handle)
         assert handle.tell() == 512
 
-        # Groups
+        # Groups, the parameter section spans the blocks from block 2 up to the data section
+        # (data_block is synced with parameter_blocks() before writing)
         handle.write(struct.pack(
-            'BBBB', 0, 0, self.parameter_blocks(), PROCESSOR_INTEL))
+            'BBBB', 0, 0, self.header.data_block - 2, PROCESSOR_INTEL))
         for group_id, group in self.group_listed():
             group.write(group_id, handle)
 
@@ -1747,28 +2190,46 @@ class Writer(Manager):
         scale = abs(self.point_scale)
         is_float = self.point_scale < 0
         if is_float:
-            point_dtype = np.float32
-            point_format = 'f'
+            point_dtype = np.dtype('<f4')
             point_scale = 1.0
         else:
-            point_dtype = np.int16
-            point_format = 'i'
+            point_dtype = np.dtype('<i2')
             point_scale = scale
-        raw = np.empty((self.point_used, 4), point_dtype)
-        for points, analog in self._frames:
-            valid = points[:, 3] > -1
-            raw[~valid, 3] = -1
-            raw[valid, :3] = points[valid, :3] / point_scale
-            raw[valid, 3] = (
-                ((points[valid, 4]).astype(np.uint8) << 8) |
-                (points[valid, 3] / scale).astype(np.uint16)
-            )
-            point = array.array(point_format)
-            point.extend(raw.flatten())
-            point.tofile(handle)
-            analog = array.array(point_format)
-            analog.extend(analog)
-            analog.tofile(handle)
+        # Analog samples are written unscaled (channel scales are 1 and offsets 0),
+        # the general scale factor is applied when the samples are read
+        gen_scale = self._gen_scale
+
+        # Convert the data of all frames at once into a single buffer, with one row of bytes per frame
+        points = np.stack(self._point_frames)
+        analog = np.stack(self._analog_frames)
+        frame_count = len(points)
+
+        valid = points[..., 3] > -1
+        raw = np.empty(points.shape[:-1] + (4,), point_dtype)
+        # Coordinates are converted for every point and written as 0 for invalid samples,
+        # which avoids gathering and scattering the valid entries
+        raw[..., :3] = np.where(valid[..., None], points[..., :3] / point_scale, 0)
+        # Pack the residual byte and camera mask of every point into the last word, -1 for invalid samples.
+        # The camera count is written as a mask with that many bits set, which is counted when read.
+        residual = np.clip(points[..., 3] / scale, 0, 255).astype(np.uint16)
+        cameras = np.clip(points[..., 4], 0, 7).astype(np.uint16)
+        raw[..., 3] = np.where(valid, (((1 << cameras) - 1) << 8) | residual, -1)
+        if analog.size:
+            # Samples are stored in file order, interleaving the channels of each sample
+            samples = analog.transpose((0, 2, 1)) / gen_scale
+            if not is_float:
+                # Integer words store whole multiples of the general scale factor, round to the
+                # nearest multiple and saturate at the range of the 16 bit words
+                np.rint(samples, out=samples)
+                np.clip(samples, -32768, 32767, out=samples)
+            raw_analog = np.empty(samples.shape, point_dtype)
+            np.copyto(raw_analog, samples, casting='unsafe')
+            # Join the point and analog bytes of each frame
+            raw = np.hstack((raw.view(np.uint8).reshape((frame_count, -1)),
+                             raw_analog.view(np.uint8).reshape((frame_count, -1))))
+
+        # The buffer is contiguous, write it without an intermediate copy
+        handle.write(raw.data)
         self._pad_block(handle)
 
     def write(self, handle, labels):
@@ -1779,8 +2240,15 @@ class Writer(Manager):
         handle : file
             Write metadata and C3D motion frames to the given file handle. The
             writer does not close the handle.
+        labels : sequence of str
+            Labels of the points, at least one label for each point in a frame.
+
+        Raises
+        ------
+        ValueError
+            If there are fewer labels than points in a frame.
         '''
-        if not self._frames:
+        if not self._point_frames:
             return
 
         def add(name, desc, bpe, format, bytes, *dimensions):
@@ -1788,43 +2256,48 @@ class Writer(Manager):
                             desc=desc,
                             bytes_per_element=bpe,
                             bytes=struct.pack(format, bytes),
-                            dimensions=list(dimensions))
+                            dimensions=dimensions)
 
         def add_str(name, desc, bytes, *dimensions):
+            add_bytes(name, desc, bytes.encode('utf-8'), *dimensions)
+
+        def add_bytes(name, desc, bytes, *dimensions):
             group.add_param(name,
                             desc=desc,
                             bytes_per_element=-1,
-                            bytes=bytes.encode('utf-8'),
-                            dimensions=list(dimensions))
+                            bytes=bytes,
+                            dimensions=dimensions)
 
         def add_empty_array(name, desc, bpe):
             group.add_param(name, desc=desc,
-                            bytes_per_element=bpe, dimensions=[0])
+                            bytes_per_element=bpe, dimensions=(0,))
 
-        points, analog = self._frames[0]
+        points, analog = self._point_frames[0], self._analog_frames[0]
         ppf = len(points)
-        labels = np.ravel(labels)
+        labels = np.ravel(labels).astype(np.str_)
+        if len(labels) < ppf:
+            raise ValueError('Expected a label for each of the {} points, got {} labels.'.format(
+                ppf, len(labels)))
 
         # POINT group
 
         # Get longest label name
-        label_max_size = 0
-        label_max_size = max(label_max_size, np.max([len(label) for label in labels]))
+        label_max_size = int(np.char.str_len(labels).max())
 
         group = self.add_group(1, 'POINT', 'POINT group')
         add('USED', 'Number of 3d markers', 2, '<H', ppf)
-        add('FRAMES', 'frame count', 2, '<H', min(65535, len(self._frames)))
+        add('FRAMES', 'frame count', 2, '<H', min(65535, len(self._point_frames)))
         add('DATA_START', 'data block number', 2, '<H', 0)
         add('SCALE', '3d scale factor', 4, '<f', np.float32(self._point_scale))
         add('RATE', '3d data capture rate', 4, '<f', np.float32(self._point_rate))
-        add_str('X_SCREEN', 'X_SCREEN parameter', '+X', 2)
-        add_str('Y_SCREEN', 'Y_SCREEN parameter', '+Y', 2)
+        add_bytes('X_SCREEN', 'X_SCREEN parameter', b'+X', 2)
+        add_bytes('Y_SCREEN', 'Y_SCREEN parameter', b'+Y', 2)
         add_str('UNITS', '3d data units',
                 self._point_units, len(self._point_units))
 
-        add_str('LABELS', 'labels', ''.join(labels[i].ljust(label_max_size)
-                for i in range(ppf)), label_max_size, ppf)
-        add_str('DESCRIPTIONS', 'descriptions', ' ' * 16 * ppf, 16, ppf)
+        padded = np.char.ljust(labels[:ppf], label_max_size)
+        add_str('LABELS', 'labels', ''.join(padded.tolist()), label_max_size, ppf)
+        add_bytes('DESCRIPTIONS', 'descriptions', b' ' * 16 * ppf, 16, ppf)
 
         # ANALOG group
         group = self.add_group(2, 'ANALOG', 'ANALOG group')
@@ -1837,7 +2310,7 @@ class Writer(Manager):
         # TRIAL group
         group = self.add_group(3, 'TRIAL', 'TRIAL group')
         add('ACTUAL_START_FIELD', 'actual start frame', 2, '<I', 1, 2)
-        add('ACTUAL_END_FIELD', 'actual end frame', 2, '<I', len(self._frames), 2)
+        add('ACTUAL_END_FIELD', 'actual end frame', 2, '<I', len(self._point_frames), 2)
 
         # sync parameter information to header.
         blocks = self.parameter_blocks()
@@ -1845,7 +2318,7 @@ class Writer(Manager):
 
         self._header.data_block = np.uint16(2 + blocks)
         self._header.frame_rate = np.float32(self._point_rate)
-        self._header.last_frame = np.uint16(min(len(self._frames), 65535))
+        self._header.last_frame = np.uint16(min(len(self._point_frames), 65535))
         self._header.point_count = np.uint16(ppf)
         self._header.analog_count = np.uint16(np.prod(analog.shape))
         self._header.analog_per_frame = np.uint16(self._analog_per_frame)
@@ -1,7 +1,10 @@
 import c3d
 import importlib
 import io
+import numpy as np
+import struct
 import unittest
+import warnings
 from test.base import Base
 from test.zipload import Zipload
 climate_spec = importlib.util.find_spec("climate")
@@ -81,6 +84,30 @@ class ReaderTest(Base):
             'analog shape: got {}, expected {}'.format(analog.shape, expected)
 
 
+    def test_all_frames(self):
+        r = c3d.Reader(Zipload._get('sample08.zip', 'TESTDPI.c3d'))
+        frames = list(r.read_frames())
+        points, analog = r.read_all_frames()
+        assert points.shape == (len(frames), r.point_used, 5), \
+            'point shape: got {}'.format(points.shape)
+        assert analog.shape == (len(frames), r.analog_used, r.analog_per_frame), \
+            'analog shape: got {}'.format(analog.shape)
+        for i, (_, p, a) in enumerate(frames):
+            assert np.array_equal(points[i], p), 'point data differ at frame index {}'.format(i)
+            assert np.array_equal(analog[i], a), 'analog data differ at frame index {}'.format(i)
+
+    def test_frames_analog_float32(self):
+        r = c3d.Reader(Zipload._get('sample08.zip', 'TESTDPI.c3d'))
+        frames = list(r.read_frames())
+        frames32 = list(r.read_frames(analog_dtype=np.float32))
+        _, analog32 = r.read_all_frames(analog_dtype=np.float32)
+        assert analog32.dtype == np.float32, 'analog dtype: got {}'.format(analog32.dtype)
+        for i, ((_, _, a), (_, _, a32)) in enumerate(zip(frames, frames32)):
+            assert a32.dtype == np.float32, 'analog dtype: got {}'.format(a32.dtype)
+            assert np.allclose(a, a32, rtol=1e-6), 'analog data differ at frame index {}'.format(i)
+            assert np.array_equal(analog32[i], a32), 'analog data differ at frame index {}'.format(i)
+
+
 class WriterTest(Base):
     def test_paramsd(self):
         r = c3d.Reader(Zipload._get('sample08.zip', 'TESTDPI.c3d'))
@@ -96,5 +123,140 @@ class WriterTest(Base):
         w.write(h, r.point_labels)
 
 
+class WriterRoundTripTest(unittest.TestCase):
+    ''' Write frames to memory and read them back, without any sample files.
+    '''
+    FRAMES = 4
+    POINTS = 8
+    CHANNELS = 3
+    GEN_SCALE = 0.5
+
+    def _frames(self):
+        rng = np.random.RandomState(0)
+        frames = []
+        for i in range(self.FRAMES):
+            points = np.zeros((self.POINTS, 5), np.float32)
+            # Multiples of 0.5 are exact for both the float and the integer (scale 0.5) writer
+            points[:, :3] = rng.randint(-2000, 2000, (self.POINTS, 3)) * 0.5
+            points[:, 3] = rng.randint(0, 255, self.POINTS) * 0.5
+            points[:, 4] = rng.randint(0, 8, self.POINTS)
+            # Mark a different point as invalid in every frame
+            points[i % self.POINTS, 3:] = -1
+            analog = rng.randint(-1000, 1000, (self.CHANNELS, 2)) * self.GEN_SCALE
+            frames.append((points, analog))
+        return frames
+
+    def _roundtrip(self, frames, point_scale):
+        w = c3d.Writer(point_rate=100., analog_rate=200., point_scale=point_scale, gen_scale=self.GEN_SCALE)
+        w.add_frames(frames)
+        h = io.BytesIO()
+        w.write(h, ['P%i' % i for i in range(self.POINTS)])
+        h.seek(0)
+        with warnings.catch_warnings():
+            # The writer does not add analog labels or descriptions
+            warnings.simplefilter('ignore')
+            r = c3d.Reader(h)
+            read = list(r.read_frames())
+        assert r.point_used == self.POINTS, 'point count: got {}'.format(r.point_used)
+        assert r.analog_used == self.CHANNELS, 'analog count: got {}'.format(r.analog_used)
+        assert len(read) == len(frames), 'frame count: got {}'.format(len(read))
+        return read
+
+    def _verify(self, frames, read):
+        for i, ((points, analog), (_, p, a)) in enumerate(zip(frames, read)):
+            valid = points[:, 3] > -1
+            assert np.array_equal(p[valid, :3], points[valid, :3]), 'xyz differ at frame index {}'.format(i)
+            assert np.array_equal(p[valid, 3], points[valid, 3]), 'residuals differ at frame index {}'.format(i)
+            assert np.array_equal(p[valid, 4], points[valid, 4]), 'camera counts differ at frame index {}'.format(i)
+            assert np.all(p[~valid, 3:] == -1), 'invalid points not read as -1 at frame index {}'.format(i)
+            assert np.array_equal(a, analog), 'analog data differ at frame index {}'.format(i)
+
+    def test_float(self):
+        frames = self._frames()
+        self._verify(frames, self._roundtrip(frames, -0.5))
+
+    def test_integer(self):
+        frames = self._frames()
+        self._verify(frames, self._roundtrip(frames, 0.5))
+
+    def test_camera_count_and_residual(self):
+        for point_scale in (-0.5, 0.5):
+            points = np.zeros((self.POINTS, 5), np.float32)
+            # Every camera count that fits in the camera mask
+            points[:, 4] = np.arange(self.POINTS)
+            # Residuals beyond the residual byte are clipped, and must not change the camera count
+            points[:, 3] = 0.5 * np.array([0, 1, 127, 254, 255, 256, 1000, 100000])
+            analog = np.zeros((self.CHANNELS, 2))
+            _, p, _ = self._roundtrip([(points, analog)], point_scale)[0]
+            assert np.array_equal(p[:, 4], np.arange(self.POINTS)), 'camera counts: got {}'.format(p[:, 4])
+            expected = 0.5 * np.array([0, 1, 127, 254, 255, 255, 255, 255])
+            assert np.array_equal(p[:, 3], expected), 'residuals: got {}'.format(p[:, 3])
+
+    def test_labels(self):
+        w = c3d.Writer()
+        w.add_frames([(np.zeros((3, 5), np.float32), np.zeros((0, 0)))])
+        h = io.BytesIO()
+        # The LABELS width follows the longest label, not the width of the array dtype
+        w.write(h, np.array(['A', 'BCD', 'EF'], dtype='U32'))
+        h.seek(0)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            param = c3d.Reader(h).get('POINT:LABELS')
+        assert tuple(param.dimensions) == (3, 3), 'LABELS dimensions: got {}'.format(param.dimensions)
+        assert param.bytes == b'A  BCDEF ', 'LABELS bytes: got {}'.format(param.bytes)
+
+    def test_missing_labels(self):
+        w = c3d.Writer()
+        w.add_frames([(np.zeros((4, 5), np.float32), np.zeros((0, 0)))])
+        h = io.BytesIO()
+        with self.assertRaises(ValueError):
+            w.write(h, ['A', 'B'])
+        assert h.tell() == 0, 'Data written before the labels were checked.'
+        # The writer is unchanged, and writes a readable file once all labels are given
+        w.write(h, ['A', 'B', 'C', 'D'])
+        h.seek(0)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            r = c3d.Reader(h)
+        assert list(r.point_labels) == ['A', 'B', 'C', 'D'], 'Labels: got {}'.format(r.point_labels)
+        assert r.get('POINT:DESCRIPTIONS') is not None, 'Parameters after LABELS not read.'
+
+    def test_integer_analog_rounding(self):
+        points = np.zeros((self.POINTS, 5), np.float32)
+        analog = np.array([[0.6, -0.6], [40000, -40000], [0.2, 1.3]])
+        _, _, a = self._roundtrip([(points, analog)], 0.5)[0]
+        # Rounded to the nearest multiple of the general scale, saturated at the 16 bit range
+        expected = np.array([[1, -1], [32767, -32768], [0, 3]]) * self.GEN_SCALE
+        assert np.array_equal(a, expected), 'analog data: got {}'.format(a)
+
+
+class ReaderMetadataTest(unittest.TestCase):
+    ''' Verify cached Reader metadata for a file written in memory.
+    '''
+    def _reader(self):
+        w = c3d.Writer(point_rate=100.)
+        w.add_frames([(np.zeros((4, 5), np.float32), np.zeros((0, 0)))] * 3)
+        h = io.BytesIO()
+        w.write(h, ['A', 'B', 'C', 'D'])
+        h.seek(0)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            return c3d.Reader(h)
+
+    def test_metadata_cleared_on_group_changes(self):
+        r = self._reader()
+        assert r.point_used == 4
+        r.rename_group('POINT', 'OLD_POINT')
+        group = r.add_group(9, 'POINT', 'POINT group')
+        group.add_param('USED', desc='count', bytes_per_element=2, bytes=struct.pack('<H', 2))
+        assert r.point_used == 2, 'Cached point count not updated: {}'.format(r.point_used)
+
+    def test_labels_not_shared(self):
+        r = self._reader()
+        labels = r.point_labels
+        labels[0] = 'X'
+        assert list(r.point_labels) == ['A', 'B', 'C', 'D'], 'Labels modified through a returned array.'
+
+
 if __name__ == '__main__':
     unittest.main()
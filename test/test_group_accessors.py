@@ -1,5 +1,7 @@
-''' Purpose for this file is to verify functions associated with Manager._groups dictionary.
+''' Purpose for this file is to verify functions associated with the Manager group dictionaries.
 '''
+import io
+import struct
 import unittest
 import c3d
 import numpy as np
@@ -150,7 +152,7 @@ class TestGroupAccessors(Base):
         # Test with option on
         new_id = ref.max_key + 2
         ref.manager.add_group(new_id, test_name, '', rename_duplicated_groups=True)
-        self.assertEqual(ref.manager._groups[new_id].name, test_name.upper() + str(new_id))
+        self.assertEqual(ref.manager._groups_by_id[new_id].name, test_name.upper() + str(new_id))
 
     def test_Manager_removing_group_from_numeric(self):
         '''Test if removing groups acts as intended.'''
@@ -219,7 +221,56 @@ class TestGroupAccessors(Base):
             pass # Correct
 
 
-
+class TestManagerGroups(unittest.TestCase):
+    ''' Tests editing groups of a Manager built in memory, no sample files are needed.
+    '''
+    def _manager(self):
+        manager = c3d.c3d.Manager()
+        manager._dtypes = c3d.DataTypes(c3d.PROCESSOR_INTEL)
+        for group_id, name in ((1, 'POINT'), (2, 'ANALOG'), (3, 'PTS')):
+            group = manager.add_group(group_id, name, '%s group' % name)
+            group.add_param('USED', desc='count', bytes_per_element=2, bytes=struct.pack('<H', 7))
+        return manager
+
+    def test_Manager_renumber_group_from_name(self):
+        '''Renumbering a group found by name replaces its numerical key and keeps its name.'''
+        manager = self._manager()
+        grp = manager.get('PTS')
+        manager.rename_group('PTS', 9)
+        assert manager.get(9) is grp, 'Group not found from the new numerical key.'
+        assert manager.get(3) is None, 'Old numerical key persisted.'
+        assert manager.get('PTS') is grp, 'Group name removed by renumbering.'
+        assert [k for k, g in manager.group_listed()] == [1, 2, 9]
+
+    def test_Manager_rename_group_bytes(self):
+        '''Names given as bytes are stored as decoded strings.'''
+        manager = self._manager()
+        grp = manager.get('PTS')
+        manager.rename_group(3, b'MARKERS')
+        assert manager.get('MARKERS') is grp, 'Group not found from the new name.'
+        assert manager.get('PTS') is None, 'Old name persisted.'
+        assert grp.name == 'MARKERS' and isinstance(grp.name, str), 'Name stored as %r.' % grp.name
+        assert sorted(manager.group_keys()) == ['ANALOG', 'MARKERS', 'POINT']
+
+    def test_Manager_remove_group_from_name(self):
+        '''Removing a group by name removes both its name and numerical keys.'''
+        manager = self._manager()
+        manager.remove_group('ANALOG')
+        assert manager.get('ANALOG') is None and manager.get(2) is None, 'Removed group persisted.'
+        assert sorted(manager.group_keys()) == ['POINT', 'PTS']
+        assert [k for k, g in manager.group_listed()] == [1, 3]
+
+    def test_Manager_parameter_blocks(self):
+        '''Each group is counted once in the size of the parameter section.'''
+        manager = self._manager()
+        manager.get('POINT').add_param('LABELS', desc='labels', bytes_per_element=-1,
+                                       bytes=b'A' * 1000, dimensions=(10, 100))
+        sizes = [g.binary_size() for g in manager.group_values()]
+        assert manager.parameter_blocks() == int(np.ceil((4 + sum(sizes)) / 512)) == 3
+        for group_id, g in manager.group_listed():
+            handle = io.BytesIO()
+            g.write(group_id, handle)
+            assert len(handle.getvalue()) == g.binary_size(), 'Written group size does not match binary_size().'
 
 
 if __name__ == '__main__':
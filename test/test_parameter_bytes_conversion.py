@@ -148,6 +148,25 @@ class ParameterArrayTest(unittest.TestCase):
             assert arr.T.shape == arr_out.shape, "Mismatch in 'float_array' converted shape"
             assert np.all(arr.T == arr_out), 'Value mismatch when reading float array'
 
+    def test_a_parse_dec_float32_array(self):
+        '''    Verify array of 32 bit DEC floating point values are parsed correctly
+        '''
+        flt_range = (-1e6, 1e6)
+        dtypes = c3d.DataTypes(c3d.PROCESSOR_DEC)
+
+        for shape in ParameterArrayTest.SHAPES:
+            arr = self.rnd.uniform(flt_range[0], flt_range[1], size=shape).astype(np.float32)
+            arr.flat[0] = 0.0
+            # Encode as DEC: increment exponent by 2 (if non-zero) and swap the 16 bit words
+            words = arr.T.flatten().view(np.uint32)
+            words = words + (words & 0x7F800000 != 0).astype(np.uint32) * np.uint32(0x01000000)
+            words = (words >> 16) | (words << 16)
+            P = c3d.Param('FLOAT_TEST', dtypes, bytes_per_element=4, dimensions=arr.shape,
+                          bytes=words.astype('<u4').tobytes())
+            arr_out = P.float32_array
+            assert arr.T.shape == arr_out.shape, "Mismatch in 'float_array' converted shape"
+            assert np.all(arr.T == arr_out), 'Value mismatch when reading DEC float array'
+
     def test_b_parse_float64_array(self):
         '''    Verify array of 64 bit floating point values are parsed correctly
         '''